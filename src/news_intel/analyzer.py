@@ -1,35 +1,120 @@
 import re
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; the compiled regex fallback gives the same results
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # optional speedup for lookaround-free, search-only patterns
+    re2 = None
 
 from .models import AnalysisResult, ClaimAssessment
 from .reference_finder import find_references
 from .text_processing import classify_claim_type, extract_claim_candidates, extract_topic
 
 
-EVIDENCE_PATTERN = re.compile(
-    r"\b(according to|data|study|report|source|document|records|official statement)\b",
+_EVIDENCE_CUES = r"according to|data|study|report|source|document|records|official statement"
+# detect_manipulation searches the whole article for this and usually finds nothing, which is where
+# re2's linear-time scan beats the backtracking engine most. Patterns iterated with finditer or using
+# lookarounds stay on `re`: re2 rejects lookarounds and has higher per-match overhead.
+# re2's \b is ASCII-only while re's treats any letter or digit (é, ß, ٣) as a word character, so the re2
+# form spells the boundaries out as Unicode classes. It only suits search(), which the caller uses.
+if re2 is not None:
+    EVIDENCE_PATTERN = re2.compile(rf"(?i)(?:^|[^\pL\pN_])(?:{_EVIDENCE_CUES})(?:[^\pL\pN_]|$)")
+else:
+    EVIDENCE_PATTERN = re.compile(rf"(?i)\b(?:{_EVIDENCE_CUES})\b")
+# One scan collects every claim feature. "according to" is both a concrete anchor and a sourcing cue, and
+# the "in/at <Name>" anchor only looks ahead so the following word can still match another group. The
+# proper-noun check is case-sensitive; under IGNORECASE alone "in the" would count as a place name.
+CLAIM_FEATURE_PATTERN = re.compile(
+    r"\b(?:(?P<sourced>according to\b)"
+    r"|(?P<specific>\d{1,4}(?:\.\d+)?%?\b|(?:january|february|march|april|may|june|july|august|"
+    r"september|october|november|december)\b|according to|(?:in|at) (?=(?-i:[A-Z][a-z])))"
+    r"|(?P<vague>(?:many|some|experts say|people say|obviously|clearly|everyone knows)\b)"
+    r"|(?P<evidence>(?:data|study|report|source|document|records|official statement)\b))",
     re.IGNORECASE,
 )
-VAGUE_PATTERN = re.compile(
-    r"\b(many|some|experts say|people say|obviously|clearly|everyone knows)\b",
-    re.IGNORECASE,
+
+# Intent and manipulation cues are matched against lowercased text, one named group per category.
+INTENT_CUES: Dict[str, Tuple[str, ...]] = {
+    "pr": ("award-winning", "industry-leading", "trusted brand", "our company", "our platform", "market-leading"),
+    "political": ("election", "senate", "congress", "government", "party", "candidate", "policy", "minister"),
+    "persuasion": ("share this", "act now", "must", "wake up", "don't ignore", "you need to"),
+    "emotional": ("shocking", "terrifying", "betrayal", "disaster", "outrage", "panic"),
+}
+MANIPULATION_CUES: Dict[str, Tuple[str, ...]] = {
+    "absolute": ("always", "never", "everyone", "no one", "all of them"),
+    "hero_villain": ("hero", "villain", "evil", "savior", "traitor"),
+    "pressure": ("shocking", "you won't believe", "terrifying", "outrage", "panic"),
+}
+
+
+def _cue_pattern(cues: Dict[str, Tuple[str, ...]]) -> "re.Pattern[str]":
+    groups = "|".join(f"(?P<{group}>{'|'.join(map(re.escape, words))})" for group, words in cues.items())
+    return re.compile(rf"\b(?:{groups})\b")
+
+
+def _cue_automaton(cues: Dict[str, Tuple[str, ...]]):
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for group, words in cues.items():
+        for word in words:
+            automaton.add_word(word, (len(word), group))
+    automaton.make_automaton()
+    return automaton
+
+
+INTENT_PATTERN = _cue_pattern(INTENT_CUES)
+MANIPULATION_PATTERN = _cue_pattern(MANIPULATION_CUES)
+_INTENT_AUTOMATON = _cue_automaton(INTENT_CUES)
+_MANIPULATION_AUTOMATON = _cue_automaton(MANIPULATION_CUES)
+
+# Ordered by precedence: the first category present in the text decides the intent.
+INTENT_LABELS = (
+    ("pr", "Reputation improvement (PR)", "Narrative emphasizes image enhancement and positive brand framing."),
+    ("political", "Political influence", "Narrative centers political actors/outcomes and likely seeks opinion shaping."),
+    ("persuasion", "Persuasion", "Direct calls-to-action indicate behavior/belief influence intent."),
+    ("emotional", "Emotional manipulation", "Emotion-heavy wording can pressure judgment over evidence review."),
 )
-SPECIFIC_PATTERN = re.compile(
-    r"(\b\d{1,4}(?:\.\d+)?%?\b|\b\d{4}\b|\b(january|february|march|april|may|june|"
-    r"july|august|september|october|november|december)\b|\b(according to|in [A-Z][a-z]+|at [A-Z][a-z]+))",
-EVIDENCE_PATTERN = re.compile(r"\b(according to|data|study|report|source|document|records|official statement)\b", re.IGNORECASE)
-VAGUE_PATTERN = re.compile(r"\b(many|some|experts say|people say|obviously|clearly|everyone knows)\b", re.IGNORECASE)
-SPECIFIC_PATTERN = re.compile(
-    r"(\b\d{1,4}(?:\.\d+)?%?\b|\b\d{4}\b|\b(january|february|march|april|may|june|july|august|"
-    r"september|october|november|december)\b|\b(according to|in [A-Z][a-z]+|at [A-Z][a-z]+))",
-    re.IGNORECASE,
+MANIPULATION_FINDINGS = (
+    ("absolute", "One-sided framing: absolute language indicates potential overgeneralization."),
+    ("hero_villain", "Hero/villain framing: binary moral narrative may suppress nuance."),
+    ("pressure", "Emotional pressure: highly charged phrasing may displace evidence-led evaluation."),
 )
 
 
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _scan_cues(t: str, pattern: "re.Pattern[str]", automaton) -> Set[str]:
+    if automaton is None:
+        return {m.lastgroup for m in pattern.finditer(t)}
+
+    hits: Set[str] = set()
+    last = len(t) - 1
+    for end, (length, group) in automaton.iter(t):
+        start = end - length + 1
+        # Mirror the regex word boundaries so "must" does not fire inside "mustard".
+        if start > 0 and _is_word_char(t[start - 1]):
+            continue
+        if end < last and _is_word_char(t[end + 1]):
+            continue
+        hits.add(group)
+    return hits
+
+
+@lru_cache(maxsize=4096)
 def assess_claim(claim: str) -> ClaimAssessment:
-    has_specific = bool(SPECIFIC_PATTERN.search(claim))
-    has_vague = bool(VAGUE_PATTERN.search(claim))
-    has_evidence = bool(EVIDENCE_PATTERN.search(claim))
+    features = {m.lastgroup for m in CLAIM_FEATURE_PATTERN.finditer(claim)}
+    has_specific = "specific" in features or "sourced" in features
+    has_vague = "vague" in features
+    has_evidence = "evidence" in features or "sourced" in features
 
     specificity = "Specific" if has_specific and not has_vague else "Vague"
     evidence_status = "Evidence cues present" if has_evidence else "No explicit evidence cues"
@@ -57,29 +142,13 @@ def assess_claim(claim: str) -> ClaimAssessment:
     )
 
 
-def infer_intent(text: str) -> Dict[str, str]:
-    t = text.lower()
-
-    if re.search(r"\b(award-winning|industry-leading|trusted brand|our company|our platform|market-leading)\b", t):
-        return {
-            "label": "Reputation improvement (PR)",
-            "reason": "Narrative emphasizes image enhancement and positive brand framing.",
-        }
-    if re.search(r"\b(election|senate|congress|government|party|candidate|policy|minister)\b", t):
-        return {
-            "label": "Political influence",
-            "reason": "Narrative centers political actors/outcomes and likely seeks opinion shaping.",
-        }
-    if re.search(r"\b(share this|act now|must|wake up|don't ignore|you need to)\b", t):
-        return {
-            "label": "Persuasion",
-            "reason": "Direct calls-to-action indicate behavior/belief influence intent.",
-        }
-    if re.search(r"\b(shocking|terrifying|betrayal|disaster|outrage|panic)\b", t):
-        return {
-            "label": "Emotional manipulation",
-            "reason": "Emotion-heavy wording can pressure judgment over evidence review.",
-        }
+def infer_intent(text: str, lowered: Optional[str] = None) -> Dict[str, str]:
+    t = text.lower() if lowered is None else lowered
+    hits = _scan_cues(t, INTENT_PATTERN, _INTENT_AUTOMATON)
+
+    for group, label, reason in INTENT_LABELS:
+        if group in hits:
+            return {"label": label, "reason": reason}
 
     return {
         "label": "Neutral information",
@@ -87,16 +156,11 @@ def infer_intent(text: str) -> Dict[str, str]:
     }
 
 
-def detect_manipulation(text: str) -> List[str]:
-    t = text.lower()
-    findings: List[str] = []
+def detect_manipulation(text: str, lowered: Optional[str] = None) -> List[str]:
+    t = text.lower() if lowered is None else lowered
+    hits = _scan_cues(t, MANIPULATION_PATTERN, _MANIPULATION_AUTOMATON)
+    findings: List[str] = [finding for group, finding in MANIPULATION_FINDINGS if group in hits]
 
-    if re.search(r"\b(always|never|everyone|no one|all of them)\b", t):
-        findings.append("One-sided framing: absolute language indicates potential overgeneralization.")
-    if re.search(r"\b(hero|villain|evil|savior|traitor)\b", t):
-        findings.append("Hero/villain framing: binary moral narrative may suppress nuance.")
-    if re.search(r"\b(shocking|you won't believe|terrifying|outrage|panic)\b", t):
-        findings.append("Emotional pressure: highly charged phrasing may displace evidence-led evaluation.")
     if not EVIDENCE_PATTERN.search(t):
         findings.append("Unsupported assertions risk: limited traceable sourcing cues in the text.")
 
@@ -126,7 +190,6 @@ def compute_scores(claims: List[ClaimAssessment], manipulation_findings: List[st
             + (18 if intent_label in {"Political influence", "Reputation improvement (PR)"} else 8),
         )
     )
-    propaganda = int(min(95, (100 - objectivity) * 0.74 + (18 if intent_label in {"Political influence", "Reputation improvement (PR)"} else 8)))
 
     return {
         "objectivity": objectivity,
@@ -140,10 +203,6 @@ def determine_final_assessment(scores: Dict[str, int], intent_label: str) -> str
     if intent_label == "Political influence" and scores["propaganda"] >= 35:
         return "Likely propaganda"
     if intent_label == "Reputation improvement (PR)" and scores["propaganda"] >= 25:
-    # Prioritize directional-intent detection before defaulting to factual.
-    if intent_label == "Political influence" and (scores["propaganda"] >= 45 or scores["objectivity"] < 95):
-        return "Likely propaganda"
-    if intent_label == "Reputation improvement (PR)":
         return "Likely PR or reputation management"
     if scores["reliability"] >= 72 and scores["objectivity"] >= 68 and scores["propaganda"] < 45:
         return "Likely factual reporting"
@@ -170,12 +229,13 @@ def build_follow_up_questions(topic: str, claims: List[ClaimAssessment], manipul
 
 
 def analyze_text(text: str) -> AnalysisResult:
-    topic = extract_topic(text)
+    lowered = text.lower()
+    topic = extract_topic(text, lowered)
     raw_claims = extract_claim_candidates(text)
     assessed_claims = [assess_claim(c) for c in raw_claims]
 
-    intent = infer_intent(text)
-    manipulation = detect_manipulation(text)
+    intent = infer_intent(text, lowered)
+    manipulation = detect_manipulation(text, lowered)
     scores = compute_scores(assessed_claims, manipulation, intent["label"])
     final = determine_final_assessment(scores, intent["label"])
 
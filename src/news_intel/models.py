@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClaimAssessment:
     claim: str
     claim_type: str
@@ -12,16 +12,30 @@ class ClaimAssessment:
     rationale: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ReferenceArticle:
     title: str
     source: str
     summary: str
     link: str
     viewpoint: str
+    # References are the same if title and source match ignoring case; the key is computed once so
+    # deduplication can hash instances directly.
+    _key: Tuple[str, str] = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_key", (self.title.casefold(), self.source.casefold()))
 
-@dataclass
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ReferenceArticle):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+
+@dataclass(slots=True)
 class AnalysisResult:
     topic: str
     claims: List[ClaimAssessment]
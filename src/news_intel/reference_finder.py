@@ -1,37 +1,120 @@
-import json
+import html
 import re
+import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import List
-from urllib.error import HTTPError, URLError
+from itertools import chain
+from typing import Callable, List, Optional, Tuple
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson as _json
+except ImportError:  # optional speedup; stdlib json also parses raw bytes
+    import json as _json
+
+try:
+    import requests_cache
+except ImportError:  # optional; without it responses are only memoized in-process
+    requests_cache = None
 
 from .models import ReferenceArticle
 
 
 USER_AGENT = "News-Intelligence-Analyzer/1.2"
+REFERENCE_CACHE_TTL = 3600
+MAX_REFERENCES = 14
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
 
+# (connect, read): pooled sockets skip the connect phase entirely, and an unreachable API fails fast
+# into the offline fallback instead of holding the report for the full read timeout.
+FETCH_TIMEOUT = (3.05, 8)
+MAX_RESPONSE_BYTES = 1_000_000
+_MAINSTREAM_SITES = urllib.parse.quote(" site:reuters.com OR site:apnews.com OR site:bbc.com")
 
-def _fetch_json(url: str, timeout: int = 8) -> dict:
-USER_AGENT = "News-Intelligence-Analyzer/1.1"
 
+def _declared_length(resp: requests.Response) -> int:
+    length = resp.headers.get("Content-Length", "")
+    return int(length) if length.isdigit() else 0
 
-def _fetch_json(url: str, timeout: int = 10) -> dict:
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode("utf-8"))
 
+def _oversized(url: str) -> ValueError:
+    return ValueError(f"Response from {url} exceeds {MAX_RESPONSE_BYTES} bytes")
 
-@lru_cache(maxsize=128)
-def fetch_wikipedia(topic: str) -> List[ReferenceArticle]:
+
+def _within_response_cap(resp: requests.Response) -> bool:
+    # requests-cache calls this before storing a response and again once its body has been read, so an
+    # oversized body is refused on its declared length up front, or dropped from the cache after the read.
+    if _declared_length(resp) > MAX_RESPONSE_BYTES:
+        return False
+    return not resp._content_consumed or len(resp.content) <= MAX_RESPONSE_BYTES
+
+
+# Shared keep-alive session: repeat lookups reuse open TLS connections instead of handshaking per call.
+# With requests-cache installed, responses also persist in SQLite across restarts and app workers.
+if requests_cache is not None:
+    _SESSION = requests_cache.CachedSession(
+        "news_intel_refs", backend="sqlite", expire_after=REFERENCE_CACHE_TTL, filter_fn=_within_response_cap
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+# Long-lived worker pool for the scatter/gather in find_references, sized to the connection pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="news-intel-refs")
+
+
+def _fetch_json(url: str, timeout: Tuple[float, float] = FETCH_TIMEOUT) -> dict:
+    # Refuse bodies that declare more than MAX_RESPONSE_BYTES, and stop streaming once an undeclared one
+    # passes it, so a pathological response cannot stall parsing.
+    try:
+        with _SESSION.get(url, timeout=timeout, stream=True) as resp:
+            resp.raise_for_status()
+            if _declared_length(resp) > MAX_RESPONSE_BYTES:
+                raise _oversized(url)
+            body = bytearray()
+            for chunk in resp.iter_content(64 * 1024):
+                body += chunk
+                if len(body) > MAX_RESPONSE_BYTES:
+                    raise _oversized(url)
+    except urllib3.exceptions.HTTPError as exc:
+        # iter_content translates urllib3 read timeouts and decode errors, but requests-cache reads the
+        # body from resp.raw to store it, so those can still escape from inside get().
+        raise requests.RequestException(exc) from exc
+    return _json.loads(body)
+
+
+def _strip_html(text: str) -> str:
+    return html.unescape(HTML_TAG_PATTERN.sub("", text)).strip()
+
+
+def _cache_key(topic: str) -> str:
+    # Both search APIs ignore case and extra whitespace, so "Ukraine" and " ukraine " share one cache slot.
+    return " ".join(topic.lower().split())
+
+
+def _cache_window() -> int:
+    # Passed as an extra cache key so memoized lookups expire after REFERENCE_CACHE_TTL seconds.
+    return int(time.monotonic() // REFERENCE_CACHE_TTL)
+
+
+@lru_cache(maxsize=512)
+def _fetch_wikipedia(topic: str, window: int) -> Tuple[ReferenceArticle, ...]:
     query = urllib.parse.quote(topic)
-    url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query}&format=json&srlimit=4"
+    # srprop=snippet drops the size/wordcount/timestamp fields that are never read.
+    url = (
+        f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={query}"
+        f"&format=json&srlimit=4&srprop=snippet"
+    )
     refs: List[ReferenceArticle] = []
     try:
         data = _fetch_json(url)
-        for item in data.get("query", {}).get("search", []):
+        for item in data.get("query", {}).get("search", [])[:4]:
             title = item.get("title", "Unknown")
-            snippet = re.sub(r"<.*?>", "", item.get("snippet", "")).replace("&quot;", '"')
+            snippet = _strip_html(item.get("snippet", ""))
             refs.append(
                 ReferenceArticle(
                     title=title,
@@ -41,22 +124,27 @@ def fetch_wikipedia(topic: str) -> List[ReferenceArticle]:
                     viewpoint="Mainstream/reference",
                 )
             )
-    except (HTTPError, URLError, TimeoutError, json.JSONDecodeError):
-    except Exception:
-        return []
-    return refs
+    except (requests.RequestException, ValueError):
+        return ()
+    return tuple(refs)
 
 
-@lru_cache(maxsize=128)
-def fetch_crossref(topic: str) -> List[ReferenceArticle]:
+def fetch_wikipedia(topic: str) -> List[ReferenceArticle]:
+    return list(_fetch_wikipedia(_cache_key(topic), _cache_window()))
+
+
+@lru_cache(maxsize=512)
+def _fetch_crossref(topic: str, window: int) -> Tuple[ReferenceArticle, ...]:
     query = urllib.parse.quote(topic)
-    url = f"https://api.crossref.org/works?query.title={query}&rows=4"
+    # select trims each work record (authors, references, funders...) to the three fields read below.
+    url = f"https://api.crossref.org/works?query.title={query}&rows=4&select=title,container-title,DOI"
     refs: List[ReferenceArticle] = []
     try:
         data = _fetch_json(url)
         for item in data.get("message", {}).get("items", [])[:4]:
-            title = (item.get("title") or ["Untitled"])[0]
-            source = (item.get("container-title") or ["Academic publication"])[0]
+            # Crossref titles often carry JATS/HTML markup such as <i> or <sub> and escaped entities.
+            title = _strip_html((item.get("title") or ["Untitled"])[0])
+            source = _strip_html((item.get("container-title") or ["Academic publication"])[0])
             doi = item.get("DOI", "")
             refs.append(
                 ReferenceArticle(
@@ -67,75 +155,85 @@ def fetch_crossref(topic: str) -> List[ReferenceArticle]:
                     viewpoint="Academic/independent",
                 )
             )
-    except (HTTPError, URLError, TimeoutError, json.JSONDecodeError):
-    except Exception:
-        return []
-    return refs
+    except (requests.RequestException, ValueError):
+        return ()
+    return tuple(refs)
+
+
+def fetch_crossref(topic: str) -> List[ReferenceArticle]:
+    return list(_fetch_crossref(_cache_key(topic), _cache_window()))
 
 
-def generate_non_mainstream(topic: str) -> List[ReferenceArticle]:
+def generate_non_mainstream(topic: str, encoded: Optional[str] = None) -> List[ReferenceArticle]:
+    # Search-link suffixes are plain words, so quote(topic + suffix) == quote(topic) + quoted suffix.
+    if encoded is None:
+        encoded = urllib.parse.quote(topic)
     return [
         ReferenceArticle(
             title=f"Independent analyses on {topic}",
             source="Independent newsletters and investigative blogs",
             summary="Check whether authors provide raw evidence, primary sources, and transparent methodology.",
-            link=f"https://duckduckgo.com/?q={urllib.parse.quote(topic + ' independent analysis')}",
-            link="",
+            link=f"https://duckduckgo.com/?q={encoded}%20independent%20analysis",
             viewpoint="Alternative viewpoint",
         ),
         ReferenceArticle(
             title=f"OSINT discussion threads about {topic}",
             source="Open-source intelligence communities",
             summary="Useful for chronology checks, geolocation, and media provenance verification.",
-            link=f"https://duckduckgo.com/?q={urllib.parse.quote(topic + ' osint discussion')}",
-            link="",
+            link=f"https://duckduckgo.com/?q={encoded}%20osint%20discussion",
             viewpoint="Obscure/OSINT",
         ),
         ReferenceArticle(
             title=f"Contrarian commentary clusters: {topic}",
             source="Niche forums and alternative media",
             summary="Use only with corroboration; identify where claims diverge from mainstream or primary-source evidence.",
-            link=f"https://duckduckgo.com/?q={urllib.parse.quote(topic + ' alternative viewpoint')}",
-            link="",
+            link=f"https://duckduckgo.com/?q={encoded}%20alternative%20viewpoint",
             viewpoint="Non-mainstream/contrarian",
         ),
     ]
 
 
-def _offline_fallback(topic: str) -> List[ReferenceArticle]:
+def _offline_fallback(topic: str, encoded: Optional[str] = None) -> List[ReferenceArticle]:
+    if encoded is None:
+        encoded = urllib.parse.quote(topic)
     return [
         ReferenceArticle(
             title=f"Mainstream coverage index: {topic}",
             source="News search",
             summary="Fallback index for mainstream reporting when APIs are unavailable.",
-            link=f"https://duckduckgo.com/?q={urllib.parse.quote(topic + ' site:reuters.com OR site:apnews.com OR site:bbc.com')}",
+            link=f"https://duckduckgo.com/?q={encoded}{_MAINSTREAM_SITES}",
             viewpoint="Mainstream/reference",
         ),
         ReferenceArticle(
             title=f"Academic index: {topic}",
             source="Google Scholar",
             summary="Fallback academic search index when Crossref access is unavailable.",
-            link=f"https://scholar.google.com/scholar?q={urllib.parse.quote(topic)}",
+            link=f"https://scholar.google.com/scholar?q={encoded}",
             viewpoint="Academic/independent",
         ),
     ]
 
 
+def _safe_fetch(fetch: Callable[[str], List[ReferenceArticle]], topic: str) -> List[ReferenceArticle]:
+    # A failing source must not sink the whole report; it simply contributes no references.
+    try:
+        return fetch(topic)
+    except Exception:
+        return []
+
+
 def find_references(topic: str) -> List[ReferenceArticle]:
-    wiki_refs = fetch_wikipedia(topic)
-    crossref_refs = fetch_crossref(topic)
-    refs = wiki_refs + crossref_refs + generate_non_mainstream(topic)
+    # Both lookups are network-bound and independent: Crossref runs on the pool while Wikipedia is
+    # fetched on the calling thread, so the wait is the slower of the two with one thread handoff.
+    crossref_future = _EXECUTOR.submit(_safe_fetch, fetch_crossref, topic)
+    wiki_refs = _safe_fetch(fetch_wikipedia, topic)
+    crossref_refs = crossref_future.result()
+
+    encoded = urllib.parse.quote(topic)
+    sources = [wiki_refs, crossref_refs, generate_non_mainstream(topic, encoded)]
     if not wiki_refs and not crossref_refs:
-        refs.extend(_offline_fallback(topic))
-def find_references(topic: str) -> List[ReferenceArticle]:
-    refs = fetch_wikipedia(topic) + fetch_crossref(topic) + generate_non_mainstream(topic)
-
-    deduped: List[ReferenceArticle] = []
-    seen = set()
-    for r in refs:
-        key = (r.title.lower().strip(), r.source.lower().strip())
-        if key in seen:
-            continue
-        seen.add(key)
-        deduped.append(r)
-    return deduped[:14]
+        sources.append(_offline_fallback(topic, encoded))
+
+    # ReferenceArticle hashes on its casefolded (title, source), so dict.fromkeys dedupes in C while keeping
+    # the first occurrence of each reference in order.
+    return list(dict.fromkeys(chain.from_iterable(sources)))[:MAX_REFERENCES]
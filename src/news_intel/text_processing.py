@@ -1,71 +1,101 @@
 import re
 from collections import Counter
-from typing import List
+from typing import Iterator, List, Optional
+
+
+STOPWORDS = frozenset({
+    "the", "a", "an", "and", "or", "to", "for", "from", "with", "that", "this", "have", "has", "had",
+    "were", "was", "are", "is", "been", "being", "into", "about", "while", "when", "where", "which", "who",
+    "what", "why", "how", "would", "could", "should", "said", "says", "according", "reported", "report", "news",
+})
+SENTENCE_BOUNDARY = re.compile(r"[.!?]\s+")
+QUESTION_LEAD = re.compile(r"^(is|are|do|does|did|can|could|should|would|will|what|why|how|when|where|who)\s+")
+ASSERTION_PATTERN = re.compile(
+    r"\b(is|are|was|were|has|have|had|will|confirmed|announced|revealed|caused|leads to|proves|demonstrates"
+    r"|according to|data shows|study finds|officials said|sources said)\b",
+    re.IGNORECASE,
+)
+CLAIM_TYPE_PATTERN = re.compile(
+    r"\b(?:(?P<predictive>will|expected|forecast|predict|likely to)"
+    r"|(?P<normative>should|must|need to|ought to)"
+    r"|(?P<evidence>according to|study|data|report|official|document|records))\b"
+)
+# Ordered by precedence: a predictive cue anywhere outranks normative and evidence cues.
+CLAIM_TYPE_LABELS = (
+    ("predictive", "Predictive"),
+    ("normative", "Normative"),
+    ("evidence", "Evidence-backed factual"),
+)
+# Topic tokens are runs of [a-zA-Z\-'] starting with a letter; runs shorter than four characters never match.
+CONTENT_TOKEN = re.compile(r"[a-zA-Z][a-zA-Z\-']{3,}")
+MAX_CLAIMS = 15
 
 
 def normalize_text(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() collapses the same Unicode whitespace runs as \s+ and drops the ends, without regex.
+    return " ".join(text.split())
+
+
+def _iter_sentences(clean: str) -> Iterator[str]:
+    # Normalized text has single spaces and no outer whitespace, so each slice is already trimmed.
+    start = 0
+    for boundary in SENTENCE_BOUNDARY.finditer(clean):
+        yield clean[start:boundary.start() + 1]
+        start = boundary.end()
+    if start < len(clean):
+        yield clean[start:]
 
 
 def split_sentences(text: str) -> List[str]:
-    sentences = re.split(r"(?<=[.!?])\s+", normalize_text(text))
-    return [s.strip() for s in sentences if s.strip()]
+    return list(_iter_sentences(normalize_text(text)))
 
 
-def extract_topic(text: str) -> str:
-    clean = normalize_text(text.lower())
+def extract_topic(text: str, lowered: Optional[str] = None) -> str:
+    clean = normalize_text(text.lower() if lowered is None else lowered)
 
     if "?" in clean:
         q = clean.split("?")[0]
-        q = re.sub(r"^(is|are|do|does|did|can|could|should|would|will|what|why|how|when|where|who)\s+", "", q)
+        q = QUESTION_LEAD.sub("", q)
         return q[:100].strip() or "general topic"
 
-    tokens = re.findall(r"[a-zA-Z][a-zA-Z\-']+", clean)
-    stop = {
-        "the", "a", "an", "and", "or", "to", "for", "from", "with", "that", "this", "have", "has", "had",
-        "were", "was", "are", "is", "been", "being", "into", "about", "while", "when", "where", "which", "who",
-        "what", "why", "how", "would", "could", "should", "said", "says", "according", "reported", "report", "news",
-    }
-
-    candidates = [t for t in tokens if len(t) > 3 and t not in stop]
-    if not candidates:
+    # Counter tallies every token in C; dropping the few stopword keys afterwards is cheaper than
+    # testing each token in Python, and leaves the first-seen order used for ties intact.
+    counts = Counter(CONTENT_TOKEN.findall(clean))
+    for word in STOPWORDS:
+        counts.pop(word, None)
+    if not counts:
         return "general topic"
 
-    top = [w for w, _ in Counter(candidates).most_common(5)]
-    return " ".join(top)
+    return " ".join(w for w, _ in counts.most_common(5))
 
 
 def extract_claim_candidates(text: str) -> List[str]:
-    sentences = split_sentences(text)
     claims: List[str] = []
 
-    assertion_patterns = [
-        r"\b(is|are|was|were|has|have|had|will|confirmed|announced|revealed|caused|leads to|proves|demonstrates)\b",
-        r"\b(according to|data shows|study finds|officials said|sources said)\b",
-    ]
-
-    for sentence in sentences:
-        if len(sentence.split()) < 4:
+    # Sentences are produced lazily so scanning stops once MAX_CLAIMS claims are found.
+    for sentence in _iter_sentences(normalize_text(text)):
+        # Single-spaced after normalization, so fewer than three spaces means fewer than four words.
+        if sentence.count(" ") < 3:
             continue
 
-        is_question = sentence.endswith("?")
-        matched = any(re.search(pattern, sentence, re.IGNORECASE) for pattern in assertion_patterns)
+        # Questions are never claims, so skip them before running the assertion scan.
+        if sentence[-1] == "?":
+            continue
 
-        if matched and not is_question:
+        if ASSERTION_PATTERN.search(sentence):
             claims.append(sentence)
+            if len(claims) == MAX_CLAIMS:
+                break
 
     if not claims and text.strip():
         claims = [normalize_text(text)]
 
-    return claims[:15]
+    return claims
 
 
 def classify_claim_type(claim: str) -> str:
-    c = claim.lower()
-    if re.search(r"\b(will|expected|forecast|predict|likely to)\b", c):
-        return "Predictive"
-    if re.search(r"\b(should|must|need to|ought to)\b", c):
-        return "Normative"
-    if re.search(r"\b(according to|study|data|report|official|document|records)\b", c):
-        return "Evidence-backed factual"
+    hits = {m.lastgroup for m in CLAIM_TYPE_PATTERN.finditer(claim.lower())}
+    for group, label in CLAIM_TYPE_LABELS:
+        if group in hits:
+            return label
     return "Factual assertion"
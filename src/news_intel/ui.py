@@ -1,15 +1,107 @@
+from bisect import bisect_right
+from html import escape
+from typing import List
+
 import streamlit as st
 
-from .models import AnalysisResult
+from .models import AnalysisResult, ClaimAssessment, ReferenceArticle
+
+
+def _build_flowers(count: int = 40) -> str:
+    # ":g" trims float noise such as 1.6500000000000001s from the inline styles sent to the browser.
+    return "".join(
+        f"<div class='flower' style='left:{(i * 2.5) % 100:g}%;font-size:{14 + (i % 7) * 6}px;"
+        f"animation-duration:{8 + (i % 9)}s,{(8 + (i % 9)) / 2:g}s;"
+        f"animation-delay:{(i * 0.33) % 10:g}s,{(i * 0.33) % 10 / 2:g}s;'>🌸</div>"
+        for i in range(count)
+    )
+
+
+# Theme chrome does not depend on the report, so build it once at import instead of on every rerun.
+_THEME_CSS = """
+<style>
+.stApp {
+    background: radial-gradient(circle at 15% 20%, #ff1e1e 0%, #ff4545 28%, #ff7f7f 55%, #ffd5d5 78%, #ffffff 100%);
+}
+.block-container {
+    max-width: 1120px;
+    padding-top: 1.4rem;
+    padding-bottom: 2.8rem;
+}
+.main-title {
+    text-align:center; font-size: 3.3rem; font-weight: 900;
+    color: #4d0000; text-shadow: 0 3px 14px rgba(255,255,255,.45);
+    letter-spacing: .6px;
+}
+.subtitle {
+    text-align:center; font-size: 1.2rem; color: #7a0e0e;
+    margin-bottom: 1rem; font-weight: 650;
+}
+.panel {
+    background: linear-gradient(180deg, rgba(255,255,255,.94), rgba(255,255,255,.86));
+    border: 1px solid rgba(255,255,255,0.68);
+    border-radius: 20px;
+    padding: 1.2rem;
+    margin-bottom: 1rem;
+    box-shadow: 0 12px 34px rgba(110,0,0,.16);
+    backdrop-filter: blur(2px);
+}
+.flower {
+    position: fixed;
+    top: -12%;
+    z-index: 0;
+    pointer-events: none;
+    opacity: 0.70;
+    animation-name: fall, dance;
+    animation-timing-function: linear, ease-in-out;
+    animation-iteration-count: infinite, infinite;
+    filter: saturate(1.5);
+}
+@keyframes fall {
+    0% { transform: translateY(-10vh) rotate(0deg); }
+    100% { transform: translateY(120vh) rotate(360deg); }
+}
+@keyframes dance {
+    0%, 100% { margin-left: 0; }
+    50% { margin-left: 52px; }
+}
+.panel-row {
+    padding: .55rem 0;
+    border-bottom: 1px solid rgba(0,0,0,.1);
+}
+.panel-row:last-child {
+    border-bottom: none;
+}
+.panel-row .meta {
+    font-size: .85rem;
+    color: rgba(49,51,63,.6);
+    margin: .2rem 0;
+}
+.kpi {
+    border-radius: 14px;
+    padding: .65rem .85rem;
+    border: 1px solid rgba(0,0,0,.08);
+    background: rgba(255,255,255,.84);
+    margin-bottom: .6rem;
+    box-shadow: inset 0 1px 0 rgba(255,255,255,.8);
+}
+</style>
+"""
+_FLOWERS_HTML = _build_flowers()
+# Emitted as a single element so each rerun sends one chrome delta instead of two.
+_THEME_HTML = _THEME_CSS + _FLOWERS_HTML
+_PANEL_OPEN = "<div class='panel'>"
+_PANEL_CLOSE = "</div>"
+
+# Score bands: below 40, 40-69, 70 and above.
+_SCORE_THRESHOLDS = (40, 70)
+_SCORE_COLORS = ("#ff3b30", "#ffc107", "#18b65e")
+_RISK_LABELS = ("High Risk", "Medium Risk", "Low Risk")
 
 
 def score_color(score: int, inverse: bool = False) -> str:
     effective = (100 - score) if inverse else score
-    if effective >= 70:
-        return "#18b65e"
-    if effective >= 40:
-        return "#ffc107"
-    return "#ff3b30"
+    return _SCORE_COLORS[bisect_right(_SCORE_THRESHOLDS, effective)]
 
 
 def render_score(label: str, score: int, inverse: bool = False) -> None:
@@ -26,126 +118,39 @@ def render_score(label: str, score: int, inverse: bool = False) -> None:
 
 
 def inject_theme() -> None:
-    st.markdown(
-        """
-        <style>
-        .stApp {
-            background: radial-gradient(circle at 15% 20%, #ff1e1e 0%, #ff4545 28%, #ff7f7f 55%, #ffd5d5 78%, #ffffff 100%);
-        }
-        .block-container {
-            max-width: 1120px;
-            padding-top: 1.4rem;
-            padding-bottom: 2.8rem;
-        }
-        .main-title {
-            text-align:center; font-size: 3.3rem; font-weight: 900;
-            color: #4d0000; text-shadow: 0 3px 14px rgba(255,255,255,.45);
-            letter-spacing: .6px;
-        }
-        .subtitle {
-            text-align:center; font-size: 1.2rem; color: #7a0e0e;
-            margin-bottom: 1rem; font-weight: 650;
-        }
-        .panel {
-            background: linear-gradient(180deg, rgba(255,255,255,.94), rgba(255,255,255,.86));
-            border: 1px solid rgba(255,255,255,0.68);
-            border-radius: 20px;
-            padding: 1.2rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 12px 34px rgba(110,0,0,.16);
-            background: radial-gradient(circle at 15% 20%, #ff2b2b 0%, #ff4d4d 28%, #ff8a8a 55%, #ffd6d6 78%, #ffffff 100%);
-        }
-        .block-container {
-            max-width: 1100px;
-            padding-top: 1.6rem;
-            padding-bottom: 2.8rem;
-        }
-        .main-title {
-            text-align:center; font-size: 3.2rem; font-weight: 900;
-            color: #520000; text-shadow: 0 3px 14px rgba(255,255,255,.35);
-            letter-spacing: 0.5px;
-        }
-        .subtitle {
-            text-align:center; font-size: 1.2rem; color: #7f0f0f;
-            margin-bottom: 1.1rem; font-weight: 600;
-        }
-        .panel {
-            background: linear-gradient(180deg, rgba(255,255,255,.92), rgba(255,255,255,.84));
-            border: 1px solid rgba(255,255,255,0.68);
-            border-radius: 18px;
-            padding: 1.15rem;
-            margin-bottom: 1rem;
-            box-shadow: 0 10px 30px rgba(110,0,0,.14);
-            backdrop-filter: blur(2px);
-        }
-        .flower {
-            position: fixed;
-            top: -12%;
-            z-index: 0;
-            pointer-events: none;
-            opacity: 0.70;
-            animation-name: fall, dance;
-            animation-timing-function: linear, ease-in-out;
-            animation-iteration-count: infinite, infinite;
-            filter: saturate(1.5);
-            opacity: 0.68;
-            animation-name: fall, dance;
-            animation-timing-function: linear, ease-in-out;
-            animation-iteration-count: infinite, infinite;
-            filter: saturate(1.35);
-        }
-        @keyframes fall {
-            0% { transform: translateY(-10vh) rotate(0deg); }
-            100% { transform: translateY(120vh) rotate(360deg); }
-        }
-        @keyframes dance {
-            0%, 100% { margin-left: 0; }
-            50% { margin-left: 52px; }
-            50% { margin-left: 46px; }
-        }
-        .kpi {
-            border-radius: 14px;
-            padding: .65rem .85rem;
-            border: 1px solid rgba(0,0,0,.08);
-            background: rgba(255,255,255,.84);
-            margin-bottom: .6rem;
-            box-shadow: inset 0 1px 0 rgba(255,255,255,.8);
-            background: rgba(255,255,255,.76);
-            margin-bottom: .5rem;
-        }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
-
-    flowers = ""
-    for i in range(40):
-        left = (i * 2.5) % 100
-        delay = (i * 0.33) % 10
-        duration = 8 + (i % 9)
-        size = 14 + (i % 7) * 6
-        flowers += (
-            f"<div class='flower' style='left:{left}%;font-size:{size}px;"
-            f"animation-duration:{duration}s,{duration/2.0}s;animation-delay:{delay}s,{delay/2}s;'>🌸</div>"
-    for i in range(36):
-        left = (i * 2.8) % 100
-        delay = (i * 0.36) % 11
-        duration = 8 + (i % 10)
-        size = 14 + (i % 7) * 6
-        flowers += (
-            f"<div class='flower' style='left:{left}%;font-size:{size}px;"
-            f"animation-duration:{duration}s,{duration/2.1}s;animation-delay:{delay}s,{delay/2}s;'>🌸</div>"
-        )
-    st.markdown(flowers, unsafe_allow_html=True)
+    st.markdown(_THEME_HTML, unsafe_allow_html=True)
 
 
 def _risk_label(score: int, inverse: bool = False) -> str:
     value = 100 - score if inverse else score
-    if value >= 70:
-        return "Low Risk"
-    if value >= 40:
-        return "Medium Risk"
-    return "High Risk"
+    return _RISK_LABELS[bisect_right(_SCORE_THRESHOLDS, value)]
+
+
+# Item lists are emitted as one HTML block per section rather than several Streamlit calls per item.
+# Claim text and API fields are untrusted and rendered with unsafe_allow_html, so everything is escaped.
+def _claims_html(claims: List[ClaimAssessment]) -> str:
+    return "".join(
+        f"<div class='panel-row'><div><strong>Claim {idx}:</strong> {escape(claim.claim)}</div>"
+        f"<div class='meta'>Type: {escape(claim.claim_type)} | Specificity: {escape(claim.specificity)} | "
+        f"Evidence: {escape(claim.evidence_status)} | Verifiability: {escape(claim.verifiability)}</div>"
+        f"<div>{escape(claim.rationale)}</div></div>"
+        for idx, claim in enumerate(claims, start=1)
+    )
+
+
+def _references_html(references: List[ReferenceArticle]) -> str:
+    return "".join(
+        f"<div class='panel-row'><div><strong>{escape(ref.title)}</strong></div>"
+        f"<div>Source: {escape(ref.source)} | Viewpoint: {escape(ref.viewpoint)}</div>"
+        f"<div>{escape(ref.summary)}</div>"
+        + (f"<div><a href='{escape(ref.link)}' target='_blank'>Open source link</a></div>" if ref.link else "")
+        + "</div>"
+        for ref in references
+    )
+
+
+def _bullets_html(items: List[str]) -> str:
+    return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
 
 
 def render_report(result: AnalysisResult) -> None:
@@ -153,21 +158,21 @@ def render_report(result: AnalysisResult) -> None:
 
     col_a, col_b = st.columns([1.25, 1])
     with col_a:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### SUMMARY")
         st.write(
             f"Topic extracted: **{result.topic}**. The system extracted **{len(result.claims)}** claim(s), "
             f"evaluated verifiability and narrative intent, then produced an intelligence-style assessment."
         )
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
 
     with col_b:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### SCOREBOARD")
         render_score("Objectivity Score", result.objectivity_score)
         render_score("Factual Reliability Score", result.reliability_score)
         render_score("PR / Propaganda Probability", result.propaganda_probability, inverse=True)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
 
     c1, c2, c3 = st.columns(3)
     c1.markdown(f"<div class='kpi'><strong>Objectivity Risk:</strong> {_risk_label(result.objectivity_score)}</div>", unsafe_allow_html=True)
@@ -182,95 +187,36 @@ def render_report(result: AnalysisResult) -> None:
     ])
 
     with tab_claims:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### EXTRACTED CLAIMS")
-        for idx, claim in enumerate(result.claims, start=1):
-            st.markdown(f"**Claim {idx}:** {claim.claim}")
-            st.caption(
-                f"Type: {claim.claim_type} | Specificity: {claim.specificity} | "
-                f"Evidence: {claim.evidence_status} | Verifiability: {claim.verifiability}"
-            )
-            st.write(claim.rationale)
-            st.divider()
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_claims_html(result.claims), unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
 
     with tab_refs:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### REFERENCE FINDINGS")
         st.caption("Mainstream, non-mainstream, obscure, and alternative viewpoints for triangulation.")
-        for ref in result.references:
-            st.markdown(f"**{ref.title}**")
-            st.write(f"Source: {ref.source} | Viewpoint: {ref.viewpoint}")
-            st.write(ref.summary)
-            if ref.link:
-                st.markdown(f"[Open source link]({ref.link})")
-            st.divider()
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_references_html(result.references), unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
 
     with tab_analysis:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### LIKELY INTENT")
         st.write(f"**{result.intent_label}**")
         st.write(result.intent_reason)
 
         st.markdown("### MANIPULATION RISK")
-        for finding in result.manipulation_findings:
-            st.write(f"- {finding}")
+        st.markdown(_bullets_html(result.manipulation_findings), unsafe_allow_html=True)
 
         st.markdown("### FINAL ASSESSMENT")
         st.write(f"**{result.final_assessment}**")
 
         st.markdown("### REASONING")
         st.write(result.reasoning)
-        st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
 
     with tab_questions:
-        st.markdown("<div class='panel'>", unsafe_allow_html=True)
+        st.markdown(_PANEL_OPEN, unsafe_allow_html=True)
         st.markdown("### Further Investigation Questions")
-        for question in result.follow_up_questions:
-            st.write(f"- {question}")
-        st.markdown("</div>", unsafe_allow_html=True)
-    st.markdown("<div class='panel'>", unsafe_allow_html=True)
-    st.markdown("### EXTRACTED CLAIMS")
-    for idx, claim in enumerate(result.claims, start=1):
-        st.markdown(f"**Claim {idx}:** {claim.claim}")
-        st.caption(
-            f"Type: {claim.claim_type} | Specificity: {claim.specificity} | "
-            f"Evidence: {claim.evidence_status} | Verifiability: {claim.verifiability}"
-        )
-        st.write(claim.rationale)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    st.markdown("<div class='panel'>", unsafe_allow_html=True)
-    st.markdown("### REFERENCE FINDINGS")
-    st.caption("Mainstream, non-mainstream, obscure, and alternative viewpoints for triangulation.")
-    for ref in result.references:
-        st.markdown(f"**{ref.title}**")
-        st.write(f"Source: {ref.source} | Viewpoint: {ref.viewpoint}")
-        st.write(ref.summary)
-        if ref.link:
-            st.markdown(f"[Open source link]({ref.link})")
-        st.divider()
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    st.markdown("<div class='panel'>", unsafe_allow_html=True)
-    st.markdown("### LIKELY INTENT")
-    st.write(f"**{result.intent_label}**")
-    st.write(result.intent_reason)
-
-    st.markdown("### MANIPULATION RISK")
-    for finding in result.manipulation_findings:
-        st.write(f"- {finding}")
-
-    st.markdown("### FINAL ASSESSMENT")
-    st.write(f"**{result.final_assessment}**")
-
-    st.markdown("### REASONING")
-    st.write(result.reasoning)
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    st.markdown("<div class='panel'>", unsafe_allow_html=True)
-    st.markdown("### Further Investigation Questions")
-    for question in result.follow_up_questions:
-        st.write(f"- {question}")
-    st.markdown("</div>", unsafe_allow_html=True)
+        st.markdown(_bullets_html(result.follow_up_questions), unsafe_allow_html=True)
+        st.markdown(_PANEL_CLOSE, unsafe_allow_html=True)
@@ -1,6 +1,12 @@
 import unittest
 
-from src.news_intel.analyzer import analyze_text, determine_final_assessment
+from src.news_intel.analyzer import (
+    analyze_text,
+    assess_claim,
+    detect_manipulation,
+    determine_final_assessment,
+    infer_intent,
+)
 
 
 class AnalyzerTests(unittest.TestCase):
@@ -10,6 +16,14 @@ class AnalyzerTests(unittest.TestCase):
         self.assertGreaterEqual(len(result.claims), 1)
         self.assertGreaterEqual(len(result.references), 1)
 
+    def test_assess_claim_features(self) -> None:
+        sourced = assess_claim("According to officials the bridge reopened.")
+        self.assertEqual((sourced.specificity, sourced.verifiability), ("Specific", "High"))
+        vague = assess_claim("Some experts say the data in Berlin is wrong.")
+        self.assertEqual((vague.specificity, vague.evidence_status), ("Vague", "Evidence cues present"))
+        self.assertEqual(assess_claim("Officials met in the capital.").specificity, "Vague")
+        self.assertEqual(assess_claim("Officials met in Berlin.").specificity, "Specific")
+
     def test_final_assessment_political(self) -> None:
         label = determine_final_assessment(
             {"objectivity": 70, "reliability": 60, "propaganda": 45},
@@ -17,6 +31,16 @@ class AnalyzerTests(unittest.TestCase):
         )
         self.assertEqual(label, "Likely propaganda")
 
+    def test_infer_intent_precedence(self) -> None:
+        intent = infer_intent("Shocking! Our award-winning platform backs the senate candidate.")
+        self.assertEqual(intent["label"], "Reputation improvement (PR)")
+
+    def test_evidence_cues_respect_unicode_word_boundaries(self) -> None:
+        unsupported = "Unsupported assertions risk: limited traceable sourcing cues in the text."
+        # Non-ASCII letters attached to a cue make it part of a longer word under either regex engine.
+        self.assertIn(unsupported, detect_manipulation("sourceß dataé éstudy"))
+        self.assertNotIn(unsupported, detect_manipulation("é data, ß"))
+
 
 if __name__ == "__main__":
     unittest.main()
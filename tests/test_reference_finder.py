@@ -0,0 +1,109 @@
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+from src.news_intel import reference_finder
+from src.news_intel.models import ReferenceArticle
+from src.news_intel.reference_finder import MAX_RESPONSE_BYTES, _fetch_json, find_references
+
+BIG_BODY = b'{"pad": "' + b"x" * MAX_RESPONSE_BYTES + b'"}'
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        if path == "/ok":
+            self._send(b'{"ok": true}', {"Content-Length": "12"})
+        elif path == "/declared-big":
+            self._send(BIG_BODY, {"Content-Length": str(len(BIG_BODY))})
+        elif path == "/undeclared-big":
+            # No Content-Length: the body runs until the connection closes.
+            self.close_connection = True
+            self._send(BIG_BODY, {"Connection": "close"})
+        elif path == "/bad-gzip":
+            self._send(b"not gzip at all", {"Content-Length": "15", "Content-Encoding": "gzip"})
+        elif path == "/stall":
+            self.send_response(200)
+            self.send_header("Content-Length", "100")
+            self.end_headers()
+            self.wfile.write(b'{"partial": ')
+            self.wfile.flush()
+            time.sleep(2)
+
+    def _send(self, body: bytes, headers: dict) -> None:
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FetchJsonTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        # A per-run query string keeps URLs out of any SQLite cache left by an earlier run.
+        cls.base = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.run_id = f"?run={time.time_ns()}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def _url(self, path: str) -> str:
+        return self.base + path + self.run_id
+
+    def _assert_not_cached(self, url: str) -> None:
+        cache = getattr(reference_finder._SESSION, "cache", None)
+        if cache is not None:
+            self.assertFalse(cache.contains(url=url))
+
+    def test_small_response_parses(self) -> None:
+        self.assertEqual(_fetch_json(self._url("/ok")), {"ok": True})
+
+    def test_oversized_responses_are_rejected(self) -> None:
+        for path in ("/declared-big", "/undeclared-big"):
+            url = self._url(path)
+            with self.assertRaises(ValueError):
+                _fetch_json(url)
+            self._assert_not_cached(url)
+
+    def test_transport_errors_surface_as_request_exceptions(self) -> None:
+        for path in ("/stall", "/bad-gzip"):
+            with self.assertRaises(requests.RequestException):
+                _fetch_json(self._url(path), timeout=(1, 0.5))
+
+
+class ReferenceDedupeTests(unittest.TestCase):
+    def test_reference_equality_uses_casefolded_title_and_source(self) -> None:
+        a = ReferenceArticle(title="Straße", source="Wiki", summary="one", link="a", viewpoint="x")
+        b = ReferenceArticle(title="STRASSE", source="wiki", summary="two", link="b", viewpoint="y")
+        c = ReferenceArticle(title="Straße", source="Other", summary="one", link="a", viewpoint="x")
+        self.assertEqual(a, b)
+        self.assertEqual(hash(a), hash(b))
+        self.assertNotEqual(a, c)
+
+    def test_find_references_keeps_first_duplicate_in_order(self) -> None:
+        first = ReferenceArticle(title="Straße", source="Wiki", summary="first", link="a", viewpoint="x")
+        other = ReferenceArticle(title="Autobahn", source="Wiki", summary="other", link="b", viewpoint="x")
+        later = ReferenceArticle(title="STRASSE", source="WIKI", summary="later", link="c", viewpoint="y")
+        with patch.object(reference_finder, "fetch_wikipedia", return_value=[first, other]), \
+                patch.object(reference_finder, "fetch_crossref", return_value=[later]):
+            refs = find_references("roads")
+        self.assertEqual([r.summary for r in refs[:2]], ["first", "other"])
+        self.assertNotIn("later", [r.summary for r in refs])
+        self.assertEqual(len(refs), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
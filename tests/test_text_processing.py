@@ -1,12 +1,23 @@
 import unittest
 
-from src.news_intel.text_processing import extract_claim_candidates, extract_topic, normalize_text
+from src.news_intel.text_processing import (
+    classify_claim_type,
+    extract_claim_candidates,
+    extract_topic,
+    normalize_text,
+    split_sentences,
+)
 
 
 class TextProcessingTests(unittest.TestCase):
     def test_normalize_text(self) -> None:
         self.assertEqual(normalize_text("Hello\n\nworld   !"), "Hello world !")
 
+    def test_split_sentences(self) -> None:
+        sentences = split_sentences("  First one.  Second?\nThird! Trailing")
+        self.assertEqual(sentences, ["First one.", "Second?", "Third!", "Trailing"])
+        self.assertEqual(split_sentences("   "), [])
+
     def test_extract_topic_question(self) -> None:
         topic = extract_topic("Do aliens exist?")
         self.assertIn("aliens", topic)
@@ -16,6 +27,12 @@ class TextProcessingTests(unittest.TestCase):
         claims = extract_claim_candidates(text)
         self.assertGreaterEqual(len(claims), 1)
 
+    def test_classify_claim_type_precedence(self) -> None:
+        # The normative cue comes first in the text, but a predictive cue anywhere wins.
+        self.assertEqual(classify_claim_type("Officials must act because prices will rise."), "Predictive")
+        self.assertEqual(classify_claim_type("According to the report, we should act."), "Normative")
+        self.assertEqual(classify_claim_type("The study covered records."), "Evidence-backed factual")
+
 
 if __name__ == "__main__":
     unittest.main()